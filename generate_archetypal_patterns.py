@@ -4,72 +4,165 @@ Generate archetypal patterns from UIA templates in the form:
 "some-generic {{domain-specific}} more-generic"
 """
 
+import argparse
+import io
+import json
+import mmap
 import os
 import re
-import glob
+import sys
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 
-def load_transformation_mappings():
-    """Load the transformation mappings from analysis files"""
-    return {
-        'domain': {
-            'physical': ['region', 'area', 'land', 'environment'],
-            'social': ['functional domain', 'community', 'group', 'organization'],
-            'conceptual': ['conceptual domain', 'knowledge domain', 'intellectual area'],
-            'psychic': ['mode of awareness', 'consciousness', 'mental state']
-        },
-        'organization': {
-            'physical': ['building', 'settlement', 'structure', 'development'],
-            'social': ['institution', 'group', 'community', 'network'],
-            'conceptual': ['conceptual framework', 'knowledge system', 'theory'],
-            'psychic': ['structured awareness', 'organized thinking', 'mental framework']
-        },
-        'elements': {
-            'physical': ['materials', 'rooms', 'spaces', 'buildings'],
-            'social': ['members', 'participants', 'roles', 'positions'],
-            'conceptual': ['concepts', 'ideas', 'methods', 'approaches'],
-            'psychic': ['perceptions', 'impressions', 'insights', 'experiences']
-        },
-        'frameworks': {
-            'physical': ['cities', 'towns', 'infrastructure', 'urban areas'],
-            'social': ['institutions', 'organizations', 'systems', 'procedures'],
-            'conceptual': ['paradigms', 'schools of thought', 'theoretical systems'],
-            'psychic': ['modes of awareness', 'mental structures', 'psychological patterns']
-        },
-        'resources': {
-            'physical': ['land', 'fertility', 'agriculture', 'natural resources'],
-            'social': ['social resources', 'human resources', 'relationships'],
-            'conceptual': ['creative resources', 'intellectual resources', 'knowledge'],
-            'psychic': ['psychic resources', 'mental energy', 'awareness']
-        },
-        'relationships': {
-            'physical': ['roads', 'connections', 'networks', 'proximity'],
-            'social': ['communications', 'interactions', 'connections'],
-            'conceptual': ['conceptual links', 'logical connections', 'associations'],
-            'psychic': ['associative relationships', 'mental connections', 'psychological links']
-        }
-    }
+try:
+    import re2  # optional: google-re2, linear-time matching
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # optional: multi-pattern scanning in one pass
+except ImportError:
+    hyperscan = None
+
+UIA_DIR = Path("/home/runner/work/p235/p235/markdown/uia")
+ARC_DIR = Path("/home/runner/work/p235/p235/markdown/arc")
+ARCHIVE_FILE = ARC_DIR / "archetypal.tar"
+EXTRACT_CACHE_FILE = ARC_DIR / ".extract_cache.json"
+PLACEHOLDERS_FILE = ARC_DIR / "_placeholders.md"
+
+# Byte patterns, run directly against memory-mapped UIA files. The title
+# is matched against the first line only.
+_TITLE_RE = re.compile(rb'# (\d+) - (.+?)\r?$')
+_TEMPLATE_HEADER_RE = re.compile(rb'^## Template[ \t\r\f\v]*$', re.MULTILINE)
+
+# Words that often get replaced in domain-specific versions
+REPLACEABLE_TERMS = {
+    'domains': '{{domains}}',
+    'frameworks': '{{frameworks}}', 
+    'elements': '{{elements}}',
+    'resources': '{{resources}}',
+    'organization': '{{organization-type}}',
+    'influence': '{{influence-type}}',
+    'positions': '{{positions}}',
+    'areas': '{{areas}}',
+    'modes': '{{modes}}',
+    'patterns': '{{patterns}}',
+    'established patterns': '{{established-patterns}}',
+    'major patterns': '{{major-patterns}}'
+}
+
+# All terms in one alternation, longest first so multi-word terms such as
+# 'established patterns' win over 'patterns'; word boundaries avoid
+# partial matches. Each term has its own group, so the placeholder comes from
+# match.lastindex rather than from re-keying on the (case-folded) matched text
+_TERMS_ORDER = sorted(REPLACEABLE_TERMS, key=len, reverse=True)
+_TERMS_PATTERN = r'\b(?:' + '|'.join('(' + re.escape(term) + ')' for term in _TERMS_ORDER) + r')\b'
+# The re fallback keeps Unicode \b and case folding. RE2 also folds case by
+# Unicode rules, but its \b is ASCII-only, so next to non-ASCII letters the
+# re2 output can differ: 'éareas' is rewritten and 'domainſ' is not
+if re2 is not None:
+    _re2_options = re2.Options()
+    _re2_options.case_sensitive = False
+    _TERMS_RE = re2.compile(_TERMS_PATTERN, _re2_options)
+else:
+    _TERMS_RE = re.compile(_TERMS_PATTERN, re.IGNORECASE)
+_PLACEHOLDERS = [REPLACEABLE_TERMS[term] for term in _TERMS_ORDER]
+
+# With hyperscan, every term goes into one database scanned once per text;
+# ids index _TERMS_ORDER. The database scans the raw UTF-8 bytes (hyperscan
+# rejects \b in UCP mode), so both \b and caseless matching are ASCII-only.
+# Output equals the re path only for ASCII templates: 'éareas' is rewritten,
+# while 'domainſ' and 'poſitions' are not
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[(r'\b' + re.escape(term) + r'\b').encode('utf-8') for term in _TERMS_ORDER],
+        ids=list(range(len(_TERMS_ORDER))),
+        elements=len(_TERMS_ORDER),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_TERMS_ORDER)
+    )
+    _HS_PLACEHOLDERS = [REPLACEABLE_TERMS[term].encode('utf-8') for term in _TERMS_ORDER]
+else:
+    _HS_DB = None
+
+# Constant documentation block shared by every archetypal pattern
+_PLACEHOLDER_DOC = """
+
+## Domain Placeholders
+
+This archetypal pattern uses the following domain-specific placeholders:
+
+- `{{domains}}` → Physical: regions/areas | Social: functional domains/communities | Conceptual: knowledge domains | Psychic: modes of awareness
+- `{{frameworks}}` → Physical: cities/infrastructure | Social: institutions/systems | Conceptual: paradigms/theories | Psychic: mental structures
+- `{{elements}}` → Physical: materials/spaces | Social: members/participants | Conceptual: concepts/ideas | Psychic: perceptions/insights
+- `{{organization-type}}` → Physical: building/development | Social: institution/community | Conceptual: framework/theory | Psychic: structured awareness
+- `{{resources}}` → Physical: land/agriculture | Social: social resources | Conceptual: creative resources | Psychic: psychic resources
+- `{{influence-type}}` → Physical: influence | Social: influence | Conceptual: insight | Psychic: influence
+- `{{areas}}` → Physical: land/regions | Social: functional areas | Conceptual: domains | Psychic: modes of awareness
+- `{{positions}}` → Physical: central locations | Social: central organizations | Conceptual: central frameworks | Psychic: ordered modes
+- `{{patterns}}` → Physical: urban environments | Social: organizational patterns | Conceptual: knowledge patterns | Psychic: awareness patterns
+- `{{modes}}` → Physical: environments | Social: modes of organization | Conceptual: modes of organization | Psychic: modes of awareness
+
+"""
+
+# Whole output file as one format string; the placeholder block's literal
+# braces are escaped once here so only the four fields are substituted
+_OUTPUT_TMPL = (
+    "# {pid} - {name} (Archetypal)\n\n## Archetypal Pattern\n\n{arch}"
+    + _PLACEHOLDER_DOC.replace('{', '{{').replace('}', '}}')
+    + "## Original Template\n\n{orig}\n\n---\n*Generated from UIA Pattern {pid}*\n"
+)
+
+# --shared-includes variant: the placeholder block is written once to
+# PLACEHOLDERS_FILE and each pattern carries a one-line include instead
+_SHARED_OUTPUT_TMPL = (
+    "# {pid} - {name} (Archetypal)\n\n## Archetypal Pattern\n\n{arch}"
+    + "\n\n{{% include _placeholders.md %}}\n\n"
+    + "## Original Template\n\n{orig}\n\n---\n*Generated from UIA Pattern {pid}*\n"
+)
 
 def extract_template_content(file_path):
-    """Extract the template section from a UIA pattern file"""
+    """Extract the template section from a UIA pattern file
+    
+    The file is memory-mapped and scanned as bytes: the title comes from the
+    first line and the Template section runs up to the next heading. Only
+    those captured pieces are decoded.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract title
-        title_match = re.search(r'^# (\d+) - (.+)$', content, re.MULTILINE)
-        if not title_match:
-            return None, None, None
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None, None, None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Extract title
+                title_match = _TITLE_RE.match(mm.readline())
+                if not title_match:
+                    return None, None, None
+                
+                pattern_id = title_match.group(1).decode('utf-8')
+                pattern_name = title_match.group(2).decode('utf-8')
+                
+                # Extract template section
+                header_match = _TEMPLATE_HEADER_RE.search(mm, mm.tell())
+                if not header_match:
+                    return None, None, None
+                
+                start = header_match.end() + 1
+                end = mm.find(b'\n##', start - 1)
+                end = len(mm) if end == -1 else end + 1
+                template_content = mm[start:end].decode('utf-8').strip()
         
-        pattern_id = title_match.group(1)
-        pattern_name = title_match.group(2)
+        # Match the newline translation of text-mode reads
+        if '\r' in template_content:
+            template_content = template_content.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Extract template section
-        template_match = re.search(r'## Template\s*\n\n(.+?)(?=\n\n##|\n\n$)', content, re.DOTALL)
-        if not template_match:
+        if not template_content:
             return None, None, None
         
-        template_content = template_match.group(1).strip()
         return pattern_id, pattern_name, template_content
     
     except Exception as e:
@@ -87,102 +180,245 @@ def identify_domain_specific_terms(template_text):
         'spaces', 'areas', 'groups', 'people', 'whole', 'modes', 'awareness'
     ]
     
-    # Words that often get replaced in domain-specific versions
-    replaceable_terms = {
-        'domains': '{{domains}}',
-        'frameworks': '{{frameworks}}', 
-        'elements': '{{elements}}',
-        'resources': '{{resources}}',
-        'organization': '{{organization-type}}',
-        'influence': '{{influence-type}}',
-        'positions': '{{positions}}',
-        'areas': '{{areas}}',
-        'modes': '{{modes}}',
-        'patterns': '{{patterns}}',
-        'established patterns': '{{established-patterns}}',
-        'major patterns': '{{major-patterns}}'
-    }
-    
-    archetypal_text = template_text
-    
-    # Apply replacements
-    for term, placeholder in replaceable_terms.items():
-        # Use word boundaries to avoid partial matches
-        archetypal_text = re.sub(r'\b' + re.escape(term) + r'\b', placeholder, archetypal_text, flags=re.IGNORECASE)
-    
-    return archetypal_text
-
-def generate_archetypal_pattern(pattern_id, pattern_name, template_content):
+    if _HS_DB is not None:
+        return _hyperscan_replace(template_text)
+    
+    # Apply all replacements in a single pass
+    return _TERMS_RE.sub(lambda match: _PLACEHOLDERS[match.lastindex - 1], template_text)
+
+def _hyperscan_replace(text):
+    """Replace terms using the hyperscan database.
+    
+    Hyperscan reports every match, including 'patterns' inside 'established
+    patterns', so keep the leftmost-longest non-overlapping spans to mirror
+    the regex alternation.
+    """
+    data = text.encode('utf-8')
+    spans = []
+    _HS_DB.scan(data, match_event_handler=lambda term_id, start, end, flags, context: spans.append((start, -end, term_id)))
+    spans.sort()
+    
+    parts = []
+    pos = 0
+    for start, neg_end, term_id in spans:
+        if start < pos:
+            continue
+        parts.append(data[pos:start])
+        parts.append(_HS_PLACEHOLDERS[term_id])
+        pos = -neg_end
+    parts.append(data[pos:])
+    
+    return b''.join(parts).decode('utf-8')
+
+def generate_archetypal_pattern(pattern_id, pattern_name, template_content, shared_includes=False):
     """Generate an archetypal pattern with domain-specific placeholders"""
     
     archetypal_content = identify_domain_specific_terms(template_content)
     
-    # Create the archetypal pattern markdown
-    archetypal_pattern = f"""# {pattern_id} - {pattern_name} (Archetypal)
-
-## Archetypal Pattern
+    output_tmpl = _SHARED_OUTPUT_TMPL if shared_includes else _OUTPUT_TMPL
+    archetypal_pattern = output_tmpl.format(
+        pid=pattern_id, name=pattern_name, arch=archetypal_content, orig=template_content
+    )
+    
+    return archetypal_pattern
 
-{archetypal_content}
+def write_file(path, text):
+    """Write text as UTF-8 with raw os.write calls, skipping buffered IO"""
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Normally a single call; loop in case of a short write
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
-## Domain Placeholders
+def render_one_file(file_path, extracted=None, shared_includes=False):
+    """Generate the archetypal pattern for one UIA file without writing it.
+    
+    extracted is a cached (pattern_id, pattern_name, template_content) from
+    an earlier run; when given, the file is not read again. Returns
+    (extracted, archetypal_pattern), the last being None when the file has
+    no usable Template section.
+    """
+    if extracted is None:
+        extracted = extract_template_content(file_path)
+    pattern_id, pattern_name, template_content = extracted
+    
+    if not (pattern_id and pattern_name and template_content):
+        return extracted, None
+    
+    return extracted, generate_archetypal_pattern(pattern_id, pattern_name, template_content, shared_includes)
 
-This archetypal pattern uses the following domain-specific placeholders:
+def process_one_file(file_path, extracted=None, shared_includes=False):
+    """Generate and write the archetypal pattern for one UIA file.
+    
+    Returns (extracted, generated); kept at module level so worker
+    processes can pickle it.
+    """
+    extracted, archetypal_pattern = render_one_file(file_path, extracted, shared_includes)
+    
+    if archetypal_pattern is None:
+        return extracted, False
+    
+    # Write the archetypal pattern file
+    write_file(ARC_DIR / f"arc_{extracted[0]}.md", archetypal_pattern)
+    
+    return extracted, True
 
-- `{{{{domains}}}}` → Physical: regions/areas | Social: functional domains/communities | Conceptual: knowledge domains | Psychic: modes of awareness
-- `{{{{frameworks}}}}` → Physical: cities/infrastructure | Social: institutions/systems | Conceptual: paradigms/theories | Psychic: mental structures
-- `{{{{elements}}}}` → Physical: materials/spaces | Social: members/participants | Conceptual: concepts/ideas | Psychic: perceptions/insights
-- `{{{{organization-type}}}}` → Physical: building/development | Social: institution/community | Conceptual: framework/theory | Psychic: structured awareness
-- `{{{{resources}}}}` → Physical: land/agriculture | Social: social resources | Conceptual: creative resources | Psychic: psychic resources
-- `{{{{influence-type}}}}` → Physical: influence | Social: influence | Conceptual: insight | Psychic: influence
-- `{{{{areas}}}}` → Physical: land/regions | Social: functional areas | Conceptual: domains | Psychic: modes of awareness
-- `{{{{positions}}}}` → Physical: central locations | Social: central organizations | Conceptual: central frameworks | Psychic: ordered modes
-- `{{{{patterns}}}}` → Physical: urban environments | Social: organizational patterns | Conceptual: knowledge patterns | Psychic: awareness patterns
-- `{{{{modes}}}}` → Physical: environments | Social: modes of organization | Conceptual: modes of organization | Psychic: modes of awareness
+def load_extract_cache(script_mtime_ns):
+    """Load cached template extractions, keyed by path, mtime and size
+    
+    The cache records the mtime of the script that wrote it; if this script
+    has changed since, the extractor may have too, so the entries are
+    dropped.
+    """
+    try:
+        cache = json.loads(EXTRACT_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('script_mtime_ns') != script_mtime_ns:
+        return {}
+    return cache.get('entries', {})
 
-## Original Template
+def save_extract_cache(entries, script_mtime_ns):
+    """Write the extraction cache along with the script mtime it is valid for"""
+    cache = {'script_mtime_ns': script_mtime_ns, 'entries': entries}
+    EXTRACT_CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
 
-{template_content}
+def extract_cache_key(file_path, st):
+    """Cache key that changes whenever the file is modified"""
+    return f"{file_path}:{st.st_mtime_ns}:{st.st_size}"
 
----
-*Generated from UIA Pattern {pattern_id}*
-"""
+def is_up_to_date(file_path, st, script_mtime_ns):
+    """True if the file's arc output is newer than both it and this script.
     
-    return archetypal_pattern
+    UIA files are named after their pattern id, so the output name follows
+    from the file name without reading it.
+    """
+    output_file = ARC_DIR / f"arc_{Path(file_path).stem}.md"
+    try:
+        output_mtime_ns = os.stat(output_file).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return output_mtime_ns >= st.st_mtime_ns and output_mtime_ns >= script_mtime_ns
+
+def add_to_archive(tar, name, text):
+    """Add one file's text to an open tar archive under the given name."""
+    data = text.encode('utf-8')
+    tarinfo = tarfile.TarInfo(name=name)
+    tarinfo.size = len(data)
+    tarinfo.mtime = time.time()
+    tar.addfile(tarinfo, io.BytesIO(data))
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--archive', action='store_true',
+        help=f"write all patterns into a single {ARCHIVE_FILE.name} instead of one file each"
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help="regenerate every pattern, even if its output is up to date"
+    )
+    parser.add_argument(
+        '--shared-includes', action='store_true',
+        help=f"write the placeholder documentation once to {PLACEHOLDERS_FILE.name} and include it by reference"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function to generate all archetypal patterns"""
-    uia_dir = Path("/home/runner/work/p235/p235/markdown/uia")
-    arc_dir = Path("/home/runner/work/p235/p235/markdown/arc")
+    args = parse_args(argv)
     
     # Ensure arc directory exists
-    arc_dir.mkdir(parents=True, exist_ok=True)
+    ARC_DIR.mkdir(parents=True, exist_ok=True)
     
     # Process all UIA pattern files
-    uia_files = sorted(uia_dir.glob("*.md"))
+    with os.scandir(UIA_DIR) as entries:
+        uia_files = [entry.path for entry in entries
+                     if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)]
+    uia_files.sort()
     
     generated_count = 0
     no_template_count = 0
+    up_to_date_count = 0
+    
+    script_mtime_ns = os.stat(__file__).st_mtime_ns
     
+    # Reuse extractions for files unchanged since the last run; --force
+    # re-reads every source
+    extract_cache = {} if args.force else load_extract_cache(script_mtime_ns)
+    new_cache = {}
+    
+    # Skip files whose output is already newer than the source and this
+    # script; the archive is always rebuilt in full, and so are the files
+    # when switching to or from --shared-includes (marked by whether
+    # PLACEHOLDERS_FILE exists)
+    layout_changed = not args.archive and args.shared_includes != PLACEHOLDERS_FILE.exists()
+    incremental = not (args.archive or args.force or layout_changed)
+    
+    pending_files = []
+    cache_keys = []
+    cached = []
     for file_path in uia_files:
-        pattern_id, pattern_name, template_content = extract_template_content(file_path)
+        st = os.stat(file_path)
+        key = extract_cache_key(file_path, st)
+        if incremental and is_up_to_date(file_path, st, script_mtime_ns):
+            up_to_date_count += 1
+            if key in extract_cache:
+                new_cache[key] = extract_cache[key]
+            continue
+        pending_files.append(file_path)
+        cache_keys.append(key)
+        cached.append(extract_cache.get(key))
+    
+    # In archive mode workers only render; the parent owns the single tar handle
+    worker = render_one_file if args.archive else process_one_file
+    if args.shared_includes:
+        worker = partial(worker, shared_includes=True)
+    archive = tarfile.open(ARCHIVE_FILE, 'w') if args.archive else nullcontext()
+    
+    # Per-file status lines are collected and printed in one write at the end
+    log_lines = []
+    
+    # Files are independent, so spread them across processes; map keeps order
+    with archive as tar, ProcessPoolExecutor() as executor:
+        results = executor.map(worker, pending_files, cached, chunksize=16)
+        for key, (extracted, result) in zip(cache_keys, results):
+            new_cache[key] = list(extracted)
+            pattern_id, pattern_name, _ = extracted
+            if result:
+                if tar is not None:
+                    add_to_archive(tar, f"arc_{pattern_id}.md", result)
+                generated_count += 1
+                log_lines.append(f"Generated: arc_{pattern_id}.md - {pattern_name}")
+            elif pattern_id and pattern_name:
+                no_template_count += 1
+                log_lines.append(f"Skipped (no Template section): {pattern_id} - {pattern_name}")
         
-        if pattern_id and pattern_name and template_content:
-            archetypal_pattern = generate_archetypal_pattern(pattern_id, pattern_name, template_content)
-            
-            # Write the archetypal pattern file
-            output_file = arc_dir / f"arc_{pattern_id}.md"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(archetypal_pattern)
-            
-            generated_count += 1
-            print(f"Generated: arc_{pattern_id}.md - {pattern_name}")
-        elif pattern_id and pattern_name:
-            no_template_count += 1
-            print(f"Skipped (no Template section): {pattern_id} - {pattern_name}")
+        # The shared placeholder block goes next to the patterns that include it
+        if args.shared_includes:
+            placeholder_doc = _PLACEHOLDER_DOC.strip() + "\n"
+            if tar is not None:
+                add_to_archive(tar, PLACEHOLDERS_FILE.name, placeholder_doc)
+            else:
+                write_file(PLACEHOLDERS_FILE, placeholder_doc)
+        elif not args.archive and PLACEHOLDERS_FILE.exists():
+            PLACEHOLDERS_FILE.unlink()
     
-    print(f"\nGenerated {generated_count} archetypal patterns in {arc_dir}")
+    # Only entries for files seen this run are kept
+    if new_cache != extract_cache:
+        save_extract_cache(new_cache, script_mtime_ns)
+    
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+    
+    print(f"\nGenerated {generated_count} archetypal patterns in {ARC_DIR}")
+    print(f"Up to date (not regenerated): {up_to_date_count} patterns")
     print(f"Skipped {no_template_count} patterns without Template sections")
-    print(f"Total patterns processed: {generated_count + no_template_count}")
+    print(f"Total patterns processed: {generated_count + up_to_date_count + no_template_count}")
     
     # Create a README for the arc directory
     readme_content = f"""# Archetypal Patterns
@@ -212,16 +448,25 @@ To use an archetypal pattern:
 
 ## Generated Patterns
 
-{generated_count} archetypal patterns have been generated from the UIA template collection.
+{generated_count + up_to_date_count} archetypal patterns have been generated from the UIA template collection.
 
 ---
 *Generated from analysis of 253 UIA patterns*
 """
     
-    with open(arc_dir / "README.md", 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    # Leave the file (and its mtime) alone when nothing would change
+    readme_path = ARC_DIR / "README.md"
+    new_bytes = readme_content.encode('utf-8')
+    try:
+        unchanged = readme_path.read_bytes() == new_bytes
+    except FileNotFoundError:
+        unchanged = False
     
-    print(f"Created README.md with documentation")
+    if unchanged:
+        print("README.md is already up to date")
+    else:
+        readme_path.write_bytes(new_bytes)
+        print(f"Created README.md with documentation")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file